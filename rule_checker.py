@@ -9,19 +9,167 @@ This module processes text and ensures adherence to technical writing rules:
 5. Maximum 20 words per sentence
 """
 
+import os
 import re
 import spacy
 import argparse
-from typing import List, Dict, Tuple, Optional, Set
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional, Set, Union
 from dataclasses import dataclass
+from spacy.tokens import Span
 
-# Load spaCy model for NLP processing
+# Run pipeline inference on the GPU when one is available; falls back to
+# CPU silently otherwise
 try:
-    nlp = spacy.load("en_core_web_sm")
+    spacy.prefer_gpu()
+except Exception:
+    pass
+
+# Load spaCy model for NLP processing.  Named-entity recognition is never
+# used by the rules, so its weights are excluded entirely; the tagger,
+# attribute_ruler and lemmatizer stay because the rules read token.pos_ and
+# token.lemma_, and the parser stays to provide sentence boundaries.
+try:
+    nlp = spacy.load("en_core_web_sm", exclude=["ner"])
 except IOError:
     print("Please install the spaCy English model: python -m spacy download en_core_web_sm")
     exit(1)
 
+# Pre-compiled regex patterns (compiling once at import time avoids the
+# per-call cache lookup that re.sub/re.search with string patterns incur)
+
+# Cleanup pattern - one alternation covering every artifact the rule
+# rewrites can leave behind, so the sentence is scanned once instead of
+# once per fix.  Case-sensitivity differs per branch, hence the scoped
+# (?i:...) flag on the repeated-'the' branch only.
+_RE_CLEANUP = re.compile(
+    r'(?P<thethe>\b(?i:the\s+the)\b)'
+    r'|(?P<punct>\s+(?P<pchars>[.,!?]+))'
+    r'|(?P<dots>\.\.+)'
+    r'|(?P<caps>This Data module)'
+)
+_RE_DOUBLE_PERIOD = re.compile(r'\.\.+')
+
+
+def _cleanup_repl(match: "re.Match") -> str:
+    """Pick the fix for whichever cleanup branch matched"""
+    if match.group('thethe') is not None:
+        return 'the'
+    if match.group('punct') is not None:
+        # Drop the space before the punctuation and collapse repeated periods
+        return _RE_DOUBLE_PERIOD.sub('.', match.group('pchars'))
+    if match.group('dots') is not None:
+        return '.'
+    return 'This data module'
+
+# Rule 1 patterns
+_RE_TURN_SHAFT = re.compile(r'^\s*turn\s+shaft\s+assembly\b', re.IGNORECASE)
+_RE_TURN_SHAFT_SUB = re.compile(r'^(\s*turn\s+)shaft\s+assembly', re.IGNORECASE)
+_RE_DATA_MODULE = re.compile(r'^\s*data\s+module\s+tells', re.IGNORECASE)
+_RE_DATA_MODULE_SUB = re.compile(r'^(\s*)data\s+module', re.IGNORECASE)
+_RE_OPERATE_UNIT = re.compile(r'\boperate\s+(?!the\s|a\s|an\s)unit\b', re.IGNORECASE)
+_RE_OPERATE_UNIT_SUB = re.compile(r'\boperate\s+unit\b', re.IGNORECASE)
+
+
+def _fix_turn_shaft(sentence: str) -> Tuple[Optional[str], str]:
+    """Case 1: 'Turn shaft assembly' -> 'Turn the shaft assembly'"""
+    if _RE_TURN_SHAFT.match(sentence):
+        corrected = _RE_TURN_SHAFT_SUB.sub(r'\1the shaft assembly', sentence)
+        return corrected, "Added 'the' before 'shaft assembly'"
+    return None, ""
+
+
+def _fix_data_module(sentence: str) -> Tuple[Optional[str], str]:
+    """Case 2: 'Data module tells ...' -> 'This data module tells ...'
+
+    The dispatch key already guarantees the sentence starts with
+    'data module' rather than 'this', so only the 'tells' probe remains.
+    """
+    if _RE_DATA_MODULE.match(sentence):
+        corrected = _RE_DATA_MODULE_SUB.sub(r'\1This data module', sentence)
+        return corrected, "Added 'This' before 'data module'"
+    return None, ""
+
+
+# Rule 1 sentence-start cases, keyed on the normalized first two words so
+# compliant sentences skip the anchored regex probes entirely
+_RULE1_DISPATCH = {
+    ('turn', 'shaft'): _fix_turn_shaft,
+    ('data', 'module'): _fix_data_module,
+}
+
+# Rule 2 patterns - a single alternation covers all handled passive
+# constructions so the sentence is scanned once instead of once per verb
+_RE_PASSIVE = re.compile(
+    r'(?P<subj>.+?)\s+(?:is|are)\s+(?P<verb>supplied|held|connected)\s+by\s+(?P<agent>.+?)\.?$',
+    re.IGNORECASE
+)
+# Articles and demonstrative adjectives, for O(1) membership tests on the
+# first word of an agent phrase
+_ARTICLES = frozenset({'the', 'a', 'an', 'this', 'that', 'these', 'those'})
+
+# Sentence-terminating punctuation, hoisted so the endswith() tuple is not
+# rebuilt per call
+_END_PUNCT = ('.', '!', '?')
+
+
+def _default_article(agent: str) -> str:
+    return f"the {agent}"
+
+
+def _connected_article(agent: str) -> str:
+    # Special handling for "a switching relay" - don't add extra "the"
+    return f"a {agent}" if agent.lower().startswith('switching') else f"the {agent}"
+
+
+# Participle matched by _RE_PASSIVE -> (active verb, article chooser)
+_PASSIVE_RULES = {
+    'supplied': ('supplies', _default_article),
+    'held': ('holds', _default_article),
+    'connected': ('connects', _connected_article),
+}
+
+# Rule 4 patterns
+_RE_CAN_BE = re.compile(r'(.+?)\s+can\s+be\s+(\w+)', re.IGNORECASE)
+_RE_ARE_TO_BE = re.compile(r'^(.+?)\s+are\s+to\s+be\s+(\w+)(.+)?', re.IGNORECASE)
+
+# Rule results are a pure function of the sentence text, and technical
+# manuals repeat boilerplate sentences many times.  Cache results keyed on
+# the whitespace-normalized text so repeats become a dict lookup instead of
+# a full regex/NLP pass.  The cache is bounded; when full, the oldest
+# entry is evicted (dicts preserve insertion order).
+_CHECK_CACHE: Dict[str, Tuple[bool, str, Tuple[str, ...]]] = {}
+_CHECK_CACHE_MAX = 4096
+
+# Minimum number of documents before multi-process parsing pays for the
+# worker spawn overhead
+_MULTIPROCESS_THRESHOLD = 200
+
+# Common technical/procedural verbs that often start instructions
+# (frozenset: immutable, lowercase, checked against token lemmas)
+_IMPERATIVE_VERBS = frozenset({
+    'turn', 'set', 'check', 'remove', 'install', 'connect', 'disconnect',
+    'press', 'push', 'pull', 'rotate', 'adjust', 'calibrate', 'test',
+    'verify', 'ensure', 'confirm', 'operate', 'start', 'stop', 'open',
+    'close', 'insert', 'extract', 'replace', 'clean', 'inspect', 'measure'
+})
+
+# Past participle -> capitalized imperative form for rule 4 rewrites
+_IMPERATIVE_MAP = {
+    'continued': 'Continue',
+    'removed': 'Remove',
+    'tested': 'Test',
+    'operated': 'Operate',
+    'connected': 'Connect',
+    'supplied': 'Supply',
+    'held': 'Hold',
+    'checked': 'Check'
+}
+
+
+def _get_imperative_verb(verb: str) -> str:
+    """Convert verb to imperative form"""
+    return _IMPERATIVE_MAP.get(verb.lower(), verb.capitalize())
+
 @dataclass
 class RuleViolation:
     rule_number: int
@@ -31,97 +179,120 @@ class RuleViolation:
     explanation: str
 
 class TechnicalWritingChecker:
-    def __init__(self):
-        # Common technical/procedural verbs that often start instructions
-        self.imperative_verbs = {
-            'turn', 'set', 'check', 'remove', 'install', 'connect', 'disconnect',
-            'press', 'push', 'pull', 'rotate', 'adjust', 'calibrate', 'test',
-            'verify', 'ensure', 'confirm', 'operate', 'start', 'stop', 'open',
-            'close', 'insert', 'extract', 'replace', 'clean', 'inspect', 'measure'
-        }
-
-    def check_all_rules(self, sentence: str) -> Tuple[bool, str, List[str]]:
-        """Check all rules for a sentence and return the final corrected version"""
-        original = sentence.strip()
-        if not original.endswith(('.', '!', '?')):
+    def check_all_rules(self, sentence: Union[str, Span]) -> Tuple[bool, str, List[str]]:
+        """Check all rules for a sentence and return the final corrected version
+
+        Accepts either a raw string or an already-parsed spaCy Span; passing
+        the Span lets the token-based rules reuse the existing parse instead
+        of re-running the pipeline on the same text.
+        """
+        if isinstance(sentence, str):
+            sent_span = None
+            span_text = sentence.strip()
+        else:
+            sent_span = sentence
+            span_text = sent_span.text.strip()
+
+        cache_key = ' '.join(span_text.split())
+        cached = _CHECK_CACHE.get(cache_key)
+        if cached is not None:
+            has_any_violation, corrected, applied_rules = cached
+            return has_any_violation, corrected, list(applied_rules)
+
+        original = span_text
+        if not original.endswith(_END_PUNCT):
             original += '.'
-        
+
         corrected = original
+        # The lowercase form is computed once per rewrite and handed to the
+        # rule guards, instead of each rule re-allocating its own copy
+        corrected_lc = corrected.lower()
         applied_rules = []
-        
+
         # Rule 1: Articles and demonstratives
-        violation, new_corrected, explanation = self.check_rule1_articles(corrected)
+        violation, new_corrected, explanation = self.check_rule1_articles(corrected, corrected_lc)
         if violation:
             corrected = new_corrected
+            corrected_lc = corrected.lower()
             applied_rules.append(f"Rule 1: {explanation}")
-        
-        # Rule 2: Active voice  
-        violation, new_corrected, explanation = self.check_rule2_active_voice(corrected)
+
+        # Rule 2: Active voice
+        violation, new_corrected, explanation = self.check_rule2_active_voice(corrected, corrected_lc)
         if violation:
             corrected = new_corrected
+            corrected_lc = corrected.lower()
             applied_rules.append(f"Rule 2: {explanation}")
-        
+
+        # The stored parse is only valid while the sentence text is unchanged;
+        # once an earlier rule has rewritten it, the token rules re-parse.
+        doc = sent_span if sent_span is not None and corrected == span_text else None
+
         # Rule 3: Single instruction
-        violation, new_corrected, explanation = self.check_rule3_single_instruction(corrected)
+        violation, new_corrected, explanation = self.check_rule3_single_instruction(corrected, doc, corrected_lc)
         if violation:
             corrected = new_corrected
+            corrected_lc = corrected.lower()
+            doc = None
             applied_rules.append(f"Rule 3: {explanation}")
-        
+
         # Rule 4: Imperative form
-        violation, new_corrected, explanation = self.check_rule4_imperative(corrected)
+        violation, new_corrected, explanation = self.check_rule4_imperative(corrected, corrected_lc)
         if violation:
             corrected = new_corrected
+            doc = None
             applied_rules.append(f"Rule 4: {explanation}")
-        
+
         # Rule 5: Sentence length
-        violation, new_corrected, explanation = self.check_rule5_sentence_length(corrected)
+        violation, new_corrected, explanation = self.check_rule5_sentence_length(corrected, doc)
         if violation:
             corrected = new_corrected
             applied_rules.append(f"Rule 5: {explanation}")
         
-        # Clean up any artifacts from multiple transformations
+        # Clean up any artifacts from multiple transformations, then
+        # terminate the sentence exactly once
         corrected = self._cleanup_artifacts(corrected)
-        
+        if not corrected.endswith(_END_PUNCT):
+            corrected += '.'
+
         has_any_violation = len(applied_rules) > 0
+
+        if len(_CHECK_CACHE) >= _CHECK_CACHE_MAX:
+            _CHECK_CACHE.pop(next(iter(_CHECK_CACHE)))
+        _CHECK_CACHE[cache_key] = (has_any_violation, corrected, tuple(applied_rules))
+
         return has_any_violation, corrected, applied_rules
 
     def _cleanup_artifacts(self, sentence: str) -> str:
-        """Clean up artifacts from multiple rule applications"""
-        # Fix repeated 'the'
-        sentence = re.sub(r'\bthe\s+the\b', 'the', sentence, flags=re.IGNORECASE)
-        
-        # Fix spaces before punctuation
-        sentence = re.sub(r'\s+([.,!?])', r'\1', sentence)
-        
-        # Fix double periods
-        sentence = re.sub(r'\.\.+', '.', sentence)
-        
-        # Fix capitalization issues
-        sentence = re.sub(r'This Data module', 'This data module', sentence)
-        
-        return sentence
+        """Clean up artifacts from multiple rule applications
 
-    def check_rule1_articles(self, sentence: str) -> Tuple[bool, str, str]:
+        Fixes repeated 'the', spaces before punctuation, double periods and
+        the 'This Data module' capitalization in a single scan.
+        """
+        return _RE_CLEANUP.sub(_cleanup_repl, sentence)
+
+    def check_rule1_articles(self, sentence: str, lower: Optional[str] = None) -> Tuple[bool, str, str]:
         """Rule 1: Check for proper use of articles - conservative approach"""
+        if lower is None:
+            lower = sentence.lower()
+
         corrected = sentence
         changes_made = []
-        
-        # Only handle specific, well-defined cases to avoid over-correction
-        
-        # Case 1: "Turn shaft assembly" -> "Turn the shaft assembly"
-        if re.match(r'^\s*turn\s+shaft\s+assembly\b', sentence, re.IGNORECASE):
-            corrected = re.sub(r'^(\s*turn\s+)shaft\s+assembly', r'\1the shaft assembly', corrected, flags=re.IGNORECASE)
-            changes_made.append("Added 'the' before 'shaft assembly'")
-        
-        # Case 2: "Data module tells you how to operate unit" 
-        # Only if it starts the sentence and doesn't already have "this"
-        if re.match(r'^\s*data\s+module\s+tells', sentence, re.IGNORECASE) and not re.match(r'^\s*this\s', sentence, re.IGNORECASE):
-            corrected = re.sub(r'^(\s*)data\s+module', r'\1This data module', corrected, flags=re.IGNORECASE)
-            changes_made.append("Added 'This' before 'data module'")
-        
-        # Case 3: "operate unit" -> "operate the unit" (only if no article present)
-        if re.search(r'\boperate\s+(?!the\s|a\s|an\s)unit\b', corrected, re.IGNORECASE):
-            corrected = re.sub(r'\boperate\s+unit\b', 'operate the unit', corrected, flags=re.IGNORECASE)
+
+        # Only handle specific, well-defined cases to avoid over-correction.
+        # The sentence-start cases dispatch on the first two words, so at
+        # most one anchored regex runs and compliant sentences run none.
+        first_two = tuple(lower.split(None, 2)[:2])
+        fix = _RULE1_DISPATCH.get(first_two)
+        if fix is not None:
+            fixed, change = fix(sentence)
+            if fixed is not None:
+                corrected = fixed
+                changes_made.append(change)
+
+        # Case 3: "operate unit" -> "operate the unit" (only if no article
+        # present); the substring guard keeps the regex off clean sentences
+        if 'operate unit' in lower and _RE_OPERATE_UNIT.search(corrected):
+            corrected = _RE_OPERATE_UNIT_SUB.sub('operate the unit', corrected)
             changes_made.append("Added 'the' before 'unit'")
         
         if changes_made:
@@ -129,62 +300,59 @@ class TechnicalWritingChecker:
         
         return False, sentence, ""
 
-    def check_rule2_active_voice(self, sentence: str) -> Tuple[bool, str, str]:
+    def check_rule2_active_voice(self, sentence: str, lower: Optional[str] = None) -> Tuple[bool, str, str]:
         """Rule 2: Convert passive voice to active voice"""
-        
-        # Pattern 1: "X are supplied by Y" -> "Y supplies X"
-        match = re.search(r'(.+?)\s+are\s+supplied\s+by\s+(.+?)\.?$', sentence, re.IGNORECASE)
-        if match:
-            subject = match.group(1).strip()
-            agent = match.group(2).strip().rstrip('.')
-            if not re.match(r'^(the|a|an|this|that)\b', agent.lower()):
-                agent = f"the {agent}"
-            corrected = f"{agent.capitalize()} supplies {subject.lower()}."
-            return True, corrected, "Converted from passive to active voice"
-        
-        # Pattern 2: "X is held by Y" -> "Y holds X"
-        match = re.search(r'(.+?)\s+is\s+held\s+by\s+(.+?)\.?$', sentence, re.IGNORECASE)
-        if match:
-            subject = match.group(1).strip()
-            agent = match.group(2).strip().rstrip('.')
-            if not re.match(r'^(the|a|an|this|that)\b', agent.lower()):
-                agent = f"the {agent}"
-            corrected = f"{agent.capitalize()} holds {subject.lower()}."
-            return True, corrected, "Converted from passive to active voice"
-        
-        # Pattern 3: "X are connected by Y" -> "Y connects X"
-        match = re.search(r'(.+?)\s+are\s+connected\s+by\s+(.+?)\.?$', sentence, re.IGNORECASE)
+        # Every handled passive construction contains ' by ', so a C-level
+        # substring test screens out active sentences before the regex runs
+        if lower is None:
+            lower = sentence.lower()
+        if ' by ' not in lower:
+            return False, sentence, ""
+
+        # "X is/are supplied/held/connected by Y" -> "Y supplies/holds/connects X"
+        match = _RE_PASSIVE.search(sentence)
         if match:
-            subject = match.group(1).strip()
-            agent = match.group(2).strip().rstrip('.')
-            # Special handling for "a switching relay" - don't add extra "the"
-            if not re.match(r'^(the|a|an|this|that)\b', agent.lower()):
-                agent = f"a {agent}" if agent.lower().startswith('switching') else f"the {agent}"
-            corrected = f"{agent.capitalize()} connects {subject.lower()}."
+            subject = match.group('subj').strip()
+            agent = match.group('agent').strip().rstrip('.')
+            active_verb, choose_article = _PASSIVE_RULES[match.group('verb').lower()]
+            first_word = agent.lower().split(None, 1)
+            if not first_word or first_word[0] not in _ARTICLES:
+                agent = choose_article(agent)
+            # The terminating period is appended once by check_all_rules
+            corrected = f"{agent.capitalize()} {active_verb} {subject.lower()}"
             return True, corrected, "Converted from passive to active voice"
 
         return False, sentence, ""
 
-    def check_rule3_single_instruction(self, sentence: str) -> Tuple[bool, str, str]:
+    def check_rule3_single_instruction(self, sentence: str, doc: Optional[Span] = None,
+                                       lower: Optional[str] = None) -> Tuple[bool, str, str]:
         """Rule 3: Ensure one instruction per sentence"""
-        
+        # Without an 'and' there is nothing to split; the substring test
+        # avoids parsing (or token-scanning) the sentence at all
+        if lower is None:
+            lower = sentence.lower()
+        if ' and' not in lower:
+            return False, sentence, ""
+
         # Look for imperative sentences with 'and' connecting two different actions
         # Only split if both parts have verbs that are in our imperative list
-        
+
         # Pattern: [Imperative verb] [content] and [imperative verb] [content]
-        doc = nlp(sentence)
-        
-        # Find 'and' tokens
-        for token in doc:
-            if token.text.lower() == 'and' and token.pos_ == 'CCONJ':
-                # Check if there are imperative verbs before and after 'and'
-                before_verbs = [t for t in doc[:token.i] if t.pos_ == 'VERB' and t.lemma_.lower() in self.imperative_verbs]
-                after_verbs = [t for t in doc[token.i+1:] if t.pos_ == 'VERB' and t.lemma_.lower() in self.imperative_verbs]
-                
-                if before_verbs and after_verbs:
+        if doc is None:
+            doc = nlp(sentence)
+
+        # Single left-to-right scan: remember whether an imperative verb has
+        # been seen, and at each 'and' only check the (lazy) suffix.  This is
+        # O(n) instead of re-scanning the prefix and suffix per 'and' token.
+        imp_set = _IMPERATIVE_VERBS
+        seen_imperative = False
+        for i, token in enumerate(doc):
+            if seen_imperative and token.text.lower() == 'and' and token.pos_ == 'CCONJ':
+                # Check if an imperative verb also follows the 'and'
+                if any(t.pos_ == 'VERB' and t.lemma_ in imp_set for t in doc[i+1:]):
                     # This looks like two separate instructions
-                    first_part = ' '.join([t.text for t in doc[:token.i]]).strip()
-                    second_part = ' '.join([t.text for t in doc[token.i+1:]]).strip().rstrip('.')
+                    first_part = doc[:i].text.strip()
+                    second_part = doc[i+1:].text.strip().rstrip('.')
                     
                     # Capitalize second part
                     if second_part and second_part[0].islower():
@@ -192,63 +360,66 @@ class TechnicalWritingChecker:
                     
                     corrected = f"A. {first_part}. B. {second_part}."
                     return True, corrected, "Split multiple instructions into separate sentences"
-        
+            elif token.pos_ == 'VERB' and token.lemma_ in imp_set:
+                seen_imperative = True
+
         return False, sentence, ""
 
-    def check_rule4_imperative(self, sentence: str) -> Tuple[bool, str, str]:
+    def check_rule4_imperative(self, sentence: str, lower: Optional[str] = None) -> Tuple[bool, str, str]:
         """Rule 4: Convert to imperative form"""
-        
+        # Both handled constructions contain one of these literal phrases
+        if lower is None:
+            lower = sentence.lower()
+        if 'can be' not in lower and 'are to be' not in lower:
+            return False, sentence, ""
+
         # Pattern 1: "The X can be continued" -> "Continue the X"
-        match = re.search(r'(.+?)\s+can\s+be\s+(\w+)', sentence, re.IGNORECASE)
+        match = _RE_CAN_BE.search(sentence)
         if match:
             subject = match.group(1).strip()
             verb = match.group(2)
-            imperative_verb = self._get_imperative_verb(verb)
+            imperative_verb = _get_imperative_verb(verb)
             corrected = f"{imperative_verb} {subject.lower()}."
             return True, corrected, "Converted to imperative form"
         
         # Pattern 2: "X are to be removed with Y" -> "Remove X with Y"
-        match = re.search(r'^(.+?)\s+are\s+to\s+be\s+(\w+)(.+)?', sentence, re.IGNORECASE)
+        match = _RE_ARE_TO_BE.search(sentence)
         if match:
             subject = match.group(1).strip()
             verb = match.group(2)
             rest = match.group(3) if match.group(3) else ""
             
-            imperative_verb = self._get_imperative_verb(verb)
+            imperative_verb = _get_imperative_verb(verb)
             corrected = f"{imperative_verb} {subject.lower()}{rest}."
             return True, corrected, "Converted to imperative form"
         
         return False, sentence, ""
 
-    def _get_imperative_verb(self, verb: str) -> str:
-        """Convert verb to imperative form"""
-        imperative_map = {
-            'continued': 'Continue',
-            'removed': 'Remove',
-            'tested': 'Test',
-            'operated': 'Operate',
-            'connected': 'Connect',
-            'supplied': 'Supply',
-            'held': 'Hold',
-            'checked': 'Check'
-        }
-        return imperative_map.get(verb.lower(), verb.capitalize())
-
-    def check_rule5_sentence_length(self, sentence: str) -> Tuple[bool, str, str]:
+    def check_rule5_sentence_length(self, sentence: str, doc: Optional[Span] = None) -> Tuple[bool, str, str]:
         """Rule 5: Check for maximum 20 words per sentence"""
+        # Cheap upper-bound test first: fewer than 20 spaces (or, with a
+        # parse available, at most 20 tokens) means at most 20 words, so the
+        # split/allocation below is skipped for typical short sentences.
+        if doc is not None:
+            if len(doc) <= 20:
+                return False, sentence, ""
+        elif sentence.count(' ') < 20:
+            return False, sentence, ""
+
         words = sentence.strip().split()
-        
+
         if len(words) > 20:
             # Try to find natural break points using NLP
-            doc = nlp(sentence)
-            
+            if doc is None:
+                doc = nlp(sentence)
+
             # Look for coordinating conjunctions that could serve as break points
-            for token in doc:
-                if (token.pos_ == 'CCONJ' and token.text.lower() in ['and', 'but'] and 
-                    token.i > 8 and token.i < len(doc) - 3):
-                    
-                    first_part = ' '.join([t.text for t in doc[:token.i]]).strip()
-                    second_part = ' '.join([t.text for t in doc[token.i+1:]]).strip()
+            for i, token in enumerate(doc):
+                if (token.pos_ == 'CCONJ' and token.text.lower() in ['and', 'but'] and
+                    i > 8 and i < len(doc) - 3):
+
+                    first_part = doc[:i].text.strip()
+                    second_part = doc[i+1:].text.strip()
                     
                     if not first_part.endswith('.'):
                         first_part += '.'
@@ -268,14 +439,32 @@ class TechnicalWritingChecker:
 
     def process_text(self, text: str) -> List[RuleViolation]:
         """Process text and return all rule violations with corrections"""
-        doc = nlp(text)
-        sentences = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
-        
+        return self._collect_violations(nlp(text))
+
+    def process_texts(self, texts: Iterable[str], n_process: int = 1) -> Iterator[List[RuleViolation]]:
+        """Process multiple texts and yield the violations for each one
+
+        Uses nlp.pipe() so the pipeline batches documents instead of paying
+        per-call overhead; much faster than calling process_text in a loop.
+        n_process > 1 parses with multiple worker processes, which is only
+        worthwhile for large batches.
+        """
+        for doc in nlp.pipe(texts, batch_size=64, n_process=max(1, n_process)):
+            yield self._collect_violations(doc)
+
+    def _collect_violations(self, doc) -> List[RuleViolation]:
+        """Run all rules over a parsed document and collect its violations"""
         all_violations = []
-        
-        for sentence in sentences:
-            has_violation, corrected, applied_rules = self.check_all_rules(sentence)
-            
+
+        # Stream doc.sents rather than materializing every sentence up
+        # front; only the (typically few) violating sentences are retained
+        for sent in doc.sents:
+            sentence = sent.text.strip()
+            if not sentence:
+                continue
+
+            has_violation, corrected, applied_rules = self.check_all_rules(sent)
+
             if has_violation:
                 explanation = "; ".join([rule.split(": ", 1)[1] for rule in applied_rules])
                 rule_numbers = [int(rule.split(":")[0].split()[1]) for rule in applied_rules]
@@ -350,10 +539,23 @@ def main():
         try:
             with open(args.input, 'r', encoding='utf-8') as f:
                 text = f.read()
-            violations = checker.process_text(text)
-            display_results(violations)
         except FileNotFoundError:
             print(f"Error: File '{args.input}' not found.")
+            return
+
+        # Batch paragraph-structured files through nlp.pipe; large batches
+        # additionally fan out across worker processes
+        paragraphs = [p for p in text.split('\n\n') if p.strip()]
+        if len(paragraphs) > 1:
+            n_process = 1
+            if len(paragraphs) > _MULTIPROCESS_THRESHOLD:
+                n_process = max(1, (os.cpu_count() or 2) // 2)
+            violations = [violation
+                          for batch in checker.process_texts(paragraphs, n_process=n_process)
+                          for violation in batch]
+        else:
+            violations = checker.process_text(text)
+        display_results(violations)
     
     elif args.text:
         violations = checker.process_text(args.text)
@@ -363,15 +565,15 @@ def main():
         # Run with sample data by default
         print("=== Technical Writing Rule Checker ===")
         print("Running with sample test cases...\n")
-        
-        for i, text in enumerate(sample_texts, 1):
+
+        results = zip(sample_texts, checker.process_texts(sample_texts))
+        for i, (text, violations) in enumerate(results, 1):
             print(f"{i}. Testing: {text}")
-            
-            has_violation, corrected, applied_rules = checker.check_all_rules(text)
-            
-            if has_violation:
-                print(f"   Issues found: {'; '.join([rule.split(': ', 1)[1] for rule in applied_rules])}")
-                print(f"   Corrected: {corrected}")
+
+            if violations:
+                for violation in violations:
+                    print(f"   Issues found: {violation.explanation}")
+                    print(f"   Corrected: {violation.corrected_sentence}")
             else:
                 print("   No violations found")
             print()